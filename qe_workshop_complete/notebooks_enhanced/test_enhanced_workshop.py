@@ -9,6 +9,11 @@ Run with: python test_enhanced_workshop.py
 All tests use mock data - no actual QE runs required.
 """
 
+import io
+import os
+import sys
+import tempfile
+
 import numpy as np
 from qe_workshop_utils import (
     # Unit conversions
@@ -18,30 +23,44 @@ from qe_workshop_utils import (
     # Shannon radii
     SHANNON_RADII, get_shannon_radius,
     # Structure validation
-    check_charge_neutrality,
+    check_charge_neutrality, check_charge_neutrality_batch,
     # Input generators
     generate_scf_input,
     # Output parsers
-    parse_scf_output,
+    parse_scf_output, parse_scf_output_path,
     # Analysis
     birch_murnaghan, fit_birch_murnaghan, analyze_convergence,
     # Stability
     check_born_stability_cubic, check_born_stability_hexagonal,
+    check_born_stability_cubic_vec, check_born_stability_hexagonal_vec,
     calculate_bulk_modulus_voigt, calculate_shear_modulus_voigt,
     # K-paths
     HIGH_SYMMETRY_POINTS, generate_kpath_card,
 )
+from workshop_setup import get_pp
+
+
+# Per-assertion lines are buffered and emitted with one stdout write per
+# test function — ~30 write syscalls collapse to ~10 on line-buffered CI.
+_LOG = io.StringIO()
+
+
+def _flush_log():
+    """Emit buffered test log lines in a single stdout write."""
+    sys.stdout.write(_LOG.getvalue())
+    _LOG.seek(0)
+    _LOG.truncate()
 
 
 def test_passed(test_name: str) -> bool:
     """Report a passed test."""
-    print(f"  ✓ {test_name}")
+    _LOG.write(f"  ✓ {test_name}\n")
     return True
 
 
 def test_failed(test_name: str, error: str) -> bool:
     """Report a failed test."""
-    print(f"  ✗ {test_name}: {error}")
+    _LOG.write(f"  ✗ {test_name}: {error}\n")
     return False
 
 
@@ -537,6 +556,92 @@ def test_kpath_generation():
     return passed, total
 
 
+# ==============================================================================
+# Test 10: Vectorized / Path-based Variants
+# ==============================================================================
+def test_vectorized_variants():
+    """Test batch/vectorized helpers against their scalar counterparts."""
+    print("\n[Test 10] Vectorized / Path-based Variants")
+    print("-" * 50)
+
+    passed = 0
+    total = 0
+
+    # 10.1 Batch charge neutrality matches the scalar loop
+    total += 1
+    ox = {'Ba': 2, 'Ti': 4, 'Fe': 3, 'O': -2}
+    comps = [
+        {'Ba': 1, 'Ti': 1, 'O': 3},   # neutral
+        {'Fe': 2, 'O': 3},            # neutral
+        {'Ba': 1, 'Ti': 1, 'O': 2},   # +2
+    ]
+    neutral_vec, charges_vec = check_charge_neutrality_batch(comps, ox)
+    scalar = [check_charge_neutrality(c, ox) for c in comps]
+    if (list(neutral_vec) == [s[0] for s in scalar]
+            and np.allclose(charges_vec, [s[1] for s in scalar])):
+        passed += test_passed("Batch charge neutrality matches scalar loop")
+    else:
+        test_failed("Batch charge neutrality",
+                    f"Got {list(neutral_vec)}, {list(charges_vec)}")
+
+    # 10.2 Vectorized cubic stability matches scalar (stable + unstable)
+    total += 1
+    C11 = np.array([166.0, 100.0])
+    C12 = np.array([64.0, 150.0])   # second set: C12 > C11 -> unstable
+    C44 = np.array([79.6, 50.0])
+    mask = check_born_stability_cubic_vec(C11, C12, C44)
+    scalar = [check_born_stability_cubic(a, b, c)[0]
+              for a, b, c in zip(C11, C12, C44)]
+    if list(mask) == scalar == [True, False]:
+        passed += test_passed("Cubic stability mask matches scalar checks")
+    else:
+        test_failed("Cubic stability vec", f"Got {list(mask)}, expected {scalar}")
+
+    # 10.3 Vectorized hexagonal stability matches scalar
+    total += 1
+    # Graphite-like (stable) and a set violating C33*(C11+C12) > 2*C13²
+    C11 = np.array([1060.0, 100.0])
+    C12 = np.array([180.0, 40.0])
+    C13 = np.array([15.0, 200.0])
+    C33 = np.array([36.5, 30.0])
+    C44 = np.array([4.5, 20.0])
+    mask = check_born_stability_hexagonal_vec(C11, C12, C13, C33, C44)
+    scalar = [check_born_stability_hexagonal(*args)[0]
+              for args in zip(C11, C12, C13, C33, C44)]
+    if list(mask) == scalar == [True, False]:
+        passed += test_passed("Hexagonal stability mask matches scalar checks")
+    else:
+        test_failed("Hexagonal stability vec", f"Got {list(mask)}, expected {scalar}")
+
+    # 10.4 parse_scf_output_path agrees with parse_scf_output
+    total += 1
+    fd, tmp_path = tempfile.mkstemp(suffix='.out')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(SAMPLE_SCF_OUTPUT)
+        from_path = parse_scf_output_path(tmp_path)
+        from_text = parse_scf_output(SAMPLE_SCF_OUTPUT)
+        mismatched = [k for k in from_text
+                      if k in from_path and not np.array_equal(
+                          np.asarray(from_path[k]), np.asarray(from_text[k]))]
+        if not mismatched:
+            passed += test_passed("parse_scf_output_path matches parse_scf_output")
+        else:
+            test_failed("parse_scf_output_path", f"Mismatched keys: {mismatched}")
+    finally:
+        os.unlink(tmp_path)
+
+    # 10.5 get_pp lookup
+    total += 1
+    entry = get_pp('PBE', 'Si')
+    if entry == (40, 8, 'Si.pbe-n-rrkjus_psl.1.0.0.UPF') and get_pp('PBE', 'Xx') is None:
+        passed += test_passed(f"get_pp('PBE', 'Si') -> {entry}")
+    else:
+        test_failed("get_pp", f"Got {entry}")
+
+    return passed, total
+
+
 # ==============================================================================
 # Main Test Runner
 # ==============================================================================
@@ -559,10 +664,12 @@ def run_all_tests():
         test_convergence_analysis,
         test_born_stability,
         test_kpath_generation,
+        test_vectorized_variants,
     ]
 
     for test_func in test_functions:
         passed, total = test_func()
+        _flush_log()
         total_passed += passed
         total_tests += total
 